@@ -1,8 +1,5 @@
 # !pip install mlflow
 
-import pandas as pd
-import seaborn as sns
-import matplotlib.pyplot as plt
 import numpy as np
 import mlflow
 import mlflow.pyfunc
@@ -13,7 +10,6 @@ from sklearn.model_selection import train_test_split
 from sklearn.metrics import roc_auc_score
 from mlflow.models.signature import infer_signature
 from mlflow.utils.environment import _mlflow_conda_env
-import cloudpickle
 import time
 import os
 from pyspark.sql.session import SparkSession
@@ -40,6 +36,9 @@ print(catalog, schema)
 #Create a SparkSession and set it as the default context
 spark = SparkSession.builder.config("spark.databricks.service.client.enabled", "true").config("spark.databricks.service.token", DATABRICKS_TOKEN).config("spark.databricks.unityCatalog.enabled", "true").getOrCreate()
 
+#Use Arrow batches for Spark <-> pandas conversion (toPandas / createDataFrame)
+spark.conf.set("spark.sql.execution.arrow.pyspark.enabled", "true")
+
 #Spark version check
 print(spark.version)
 
@@ -109,12 +108,13 @@ class WineQualityPredictor:
     def predict(self):
         """Runs inference on input data."""
         processed_data = self.preprocessor.load_data()
-        predictions = self.model.predict(processed_data)
-        
-        predictions_df = pd.DataFrame(predictions, columns=["prediction"])
-        predictions_df
-        results_df = pd.concat([processed_data, predictions_df], axis =1)
-        results_df['prediction'] = results_df['prediction'].map(lambda x: 1 if x > 0.5 else 0)
+        predictions = np.asarray(self.model.predict(processed_data))
+
+        # sklearn flavor models return predict_proba output; keep the high quality class
+        if predictions.ndim == 2:
+            predictions = predictions[:, 1]
+
+        results_df = processed_data.assign(prediction=(predictions > 0.5).astype(int))
         return results_df
 
 # Main Execution
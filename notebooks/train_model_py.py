@@ -1,20 +1,11 @@
 #!pip install mlflow
 
 import pandas as pd
-import seaborn as sns
-import matplotlib.pyplot as plt
 import numpy as np
 import mlflow
-import mlflow.pyfunc
 import mlflow.sklearn
-import sklearn
 from sklearn.ensemble import RandomForestClassifier
-from sklearn.model_selection import train_test_split
-from sklearn.metrics import roc_auc_score
 from mlflow.models.signature import infer_signature
-from mlflow.utils.environment import _mlflow_conda_env
-import cloudpickle
-import time
 from pyspark.sql.session import SparkSession
 import os
 import sys
@@ -40,6 +31,9 @@ print(catalog, schema)
 #Create a SparkSession and set it as the default context
 spark = SparkSession.builder.config("spark.databricks.service.client.enabled", "true").config("spark.databricks.service.token", DATABRICKS_TOKEN).config("spark.databricks.unityCatalog.enabled", "true").getOrCreate()
 
+#Use Arrow batches for Spark <-> pandas conversion (toPandas / createDataFrame)
+spark.conf.set("spark.sql.execution.arrow.pyspark.enabled", "true")
+
 #mlflow uri setup
 mlflow.set_registry_uri("databricks-uc")
 mlflow.set_tracking_uri("databricks")
@@ -79,7 +73,7 @@ class WineDataProcessor:
 
         red_wine['is_red'] = 1
         white_wine['is_red'] = 0
-        data = pd.concat([red_wine, white_wine], axis=0)
+        data = pd.concat([red_wine, white_wine], ignore_index=True)
 
         # Clean column names
         data.rename(columns=lambda x: x.replace(' ', '_'), inplace=True)
@@ -95,48 +89,75 @@ class WineDataProcessor:
         X = self.data.drop(["quality"], axis=1)
         y = self.data.quality
 
-        X_train, X_rem, y_train, y_rem = train_test_split(X, y, train_size=1-test_size-val_size, random_state=123)
-        X_val, X_test, y_val, y_test = train_test_split(X_rem, y_rem, test_size=val_size/(test_size+val_size), random_state=123)
+        #Single stratified shuffle: permute each class once and slice it into train/val/test
+        rng = np.random.default_rng(123)
+        y_arr = y.to_numpy()
+        train_idx, val_idx, test_idx = [], [], []
+        for label in np.unique(y_arr):
+            idx = rng.permutation(np.flatnonzero(y_arr == label))
+            n_train = int(round(len(idx) * (1 - test_size - val_size)))
+            n_val = int(round(len(idx) * val_size))
+            train_idx.append(idx[:n_train])
+            val_idx.append(idx[n_train:n_train + n_val])
+            test_idx.append(idx[n_train + n_val:])
+
+        train_idx, val_idx, test_idx = (rng.permutation(np.concatenate(i)) for i in (train_idx, val_idx, test_idx))
+        X_train, X_val, X_test = X.take(train_idx), X.take(val_idx), X.take(test_idx)
+        y_train, y_val, y_test = y.take(train_idx), y.take(val_idx), y.take(test_idx)
 
         return X_train, X_val, X_test, y_train, y_val, y_test
 
-# 2. Model Wrapper Class
-class SklearnModelWrapper(mlflow.pyfunc.PythonModel):
-    def __init__(self, model):
-        self.model = model
+def fast_auc(y_true, y_score):
+    """Computes binary ROC AUC from score ranks (Mann-Whitney U), with ties sharing their average rank."""
+    y_true = np.asarray(y_true)
+    y_score = np.asarray(y_score)
+
+    if not np.isin(y_true, [0, 1]).all():
+        raise ValueError("y_true must contain only 0/1 labels.")
+    if not np.isfinite(y_score).all():
+        raise ValueError("y_score contains NaN or infinite values.")
+
+    n_pos = int((y_true == 1).sum())
+    n_neg = len(y_true) - n_pos
+    if n_pos == 0 or n_neg == 0:
+        raise ValueError("Only one class present in y_true. ROC AUC score is not defined in that case.")
 
-    def predict(self, context, model_input):
-        return self.model.predict_proba(model_input)[:,1]
+    order = np.argsort(y_score, kind="mergesort")
+    sorted_score = y_score[order]
 
-# 3. Machine Learning Model Class
+    # Average 1-based rank for each run of tied scores
+    starts = np.concatenate(([0], np.flatnonzero(np.diff(sorted_score)) + 1))
+    counts = np.diff(np.append(starts, len(sorted_score)))
+    ranks = np.empty(len(sorted_score), dtype=np.float64)
+    ranks[order] = np.repeat(starts + (counts + 1) / 2.0, counts)
+
+    return float((ranks[y_true == 1].sum() - n_pos * (n_pos + 1) / 2.0) / (n_pos * n_neg))
+
+# 2. Machine Learning Model Class
 class WineQualityModel:
-    def __init__(self, model=RandomForestClassifier(n_estimators=10, random_state=123)):
+    def __init__(self, model=RandomForestClassifier(n_estimators=10, n_jobs=-1, random_state=123)):
         self.model = model
 
     def train(self, X_train, y_train):
         """Trains the model."""
-        self.model.fit(X_train, y_train)
+        #Fit on float32 features (sklearn's tree dtype) so fit does not copy them again
+        self.model.fit(X_train.astype(np.float32, copy=False), y_train)
 
     def evaluate(self, X_test, y_test):
         """Evaluates the model using ROC AUC score."""
         predictions = self.model.predict_proba(X_test)[:,1]
-        auc_score = roc_auc_score(y_test, predictions)
+        auc_score = fast_auc(y_test, predictions)
         return auc_score
 
     def log_model(self, X_train):
         """Logs the model using MLflow."""
-        wrappedModel = SklearnModelWrapper(self.model)
-        signature = infer_signature(X_train, wrappedModel.predict(None, X_train))
-
-        conda_env = _mlflow_conda_env(
-            additional_conda_deps=None,
-            additional_pip_deps=["cloudpickle=={}".format(cloudpickle.__version__), "scikit-learn=={}".format(sklearn.__version__)],
-            additional_conda_channels=None,
-        )
+        #Only dtypes and shapes matter for the signature, so infer it from a small sample
+        sample = X_train.head(5)
+        signature = infer_signature(sample, self.model.predict_proba(sample))
 
-        mlflow.pyfunc.log_model("wine_quality_model", python_model=wrappedModel, conda_env=conda_env, signature=signature)
+        mlflow.sklearn.log_model(self.model, "wine_quality_model", signature=signature, pyfunc_predict_fn="predict_proba")
 
-# 4. MLflow Experiment Class
+# 3. MLflow Experiment Class
 class MLflowExperiment:
     def __init__(self, model_name="wine_quality_model"):
         self.model_name = model_name
@@ -147,7 +168,7 @@ class MLflowExperiment:
         mlflow.set_tracking_uri("databricks")
         print("Tracking UI:", mlflow.get_tracking_uri())
         
-        with mlflow.start_run(run_name='wine_model_training_run'):
+        with mlflow.start_run(run_name='wine_model_training_run') as run:
             model.train(X_train, y_train)
             auc_score = model.evaluate(X_test, y_test)
 
@@ -155,17 +176,17 @@ class MLflowExperiment:
             mlflow.log_metric('auc', auc_score)
             model.log_model(X_train)
 
-            return mlflow.search_runs(filter_string='tags.mlflow.runName = "wine_model_training_run"').iloc[0].run_id
+            return run.info.run_id
 
     def register_model(self, run_id):
         """Registers the trained model in MLflow."""
+        # register_model blocks until the version is READY and raises if registration fails
         model_version = mlflow.register_model(f"runs:/{run_id}/wine_quality_model", self.model_name)
         client = mlflow.MlflowClient()
         client.set_registered_model_alias(self.model_name, "production", version=model_version.version)
-        time.sleep(15)  # Wait for registration to complete
         return model_version
 
-# 5. Feature Importance Class
+# 4. Feature Importance Class
 class FeatureImportance:
     @staticmethod
     def get_importance(model, X_train):
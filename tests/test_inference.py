@@ -16,6 +16,12 @@ class MockModel:
     def predict(self, X):
         return np.random.rand(len(X))  # Simulated probability outputs
 
+# Mock sklearn flavor model returning predict_proba output
+class MockProbaModel:
+    def predict(self, X):
+        positive = np.resize([0.1, 0.3, 0.45, 0.7, 0.9], len(X))
+        return np.column_stack([1 - positive, positive])
+
 @pytest.fixture
 def mock_model_loader():
     """Fixture to mock the model loading."""
@@ -49,6 +55,17 @@ def test_prediction_output(mock_model_loader, mock_data_processor):
     assert np.all((predictions >= 0) & (predictions <= 1)), "Predictions should be between 0 and 1"
 
 
+def test_prediction_from_predict_proba(mock_data_processor):
+    """Test that 2-D predict_proba output is thresholded on the high quality class."""
+    model_loader = ModelLoader("wine_quality")
+    model_loader.model = MockProbaModel()
+    mock_data_processor.load_data = MagicMock(return_value=mock_data_processor.data)
+
+    results_df = WineQualityPredictor(model_loader, mock_data_processor).predict()
+
+    assert list(results_df['prediction']) == [0, 0, 0, 1, 1], "Predictions should threshold the positive-class probability"
+    assert results_df.shape[0] == 5, "Results should keep one row per input sample"
+
 #To test in UI
 # if __name__ == "__main__":
 #     pytest.main()
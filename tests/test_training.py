@@ -8,7 +8,8 @@ import pandas as pd
 import numpy as np
 from unittest.mock import MagicMock
 from sklearn.ensemble import RandomForestClassifier
-from train_model_py import WineDataProcessor, WineQualityModel, MLflowExperiment, FeatureImportance
+from sklearn.metrics import roc_auc_score
+from train_model_py import WineDataProcessor, WineQualityModel, MLflowExperiment, FeatureImportance, fast_auc
 import mlflow
 import mlflow.pyfunc
 import mlflow.sklearn
@@ -36,6 +37,26 @@ def test_data_loading(mock_data):
     assert X_train.shape[0] > 0, "Training data should have samples"
     assert len(y_train) == X_train.shape[0], "X_train and y_train should have the same number of samples"
 
+def test_split_data_stratified():
+    """Test split sizes, disjointness and class balance on synthetic data (no Spark needed)."""
+    processor = WineDataProcessor()
+    processor.data = pd.DataFrame({
+        'alcohol': np.random.default_rng(0).random(1000),
+        'is_red': np.tile([0, 1], 500),
+        'quality': np.repeat([1, 0], [200, 800]),
+    })
+    X_train, X_val, X_test, y_train, y_val, y_test = processor.split_data()
+
+    assert (len(X_train), len(X_val), len(X_test)) == (600, 200, 200), "Splits should follow the 60/20/20 ratio"
+    assert all((X.index == y.index).all() for X, y in [(X_train, y_train), (X_val, y_val), (X_test, y_test)]), "Features and labels should stay aligned"
+
+    train_rows, val_rows, test_rows = set(X_train.index), set(X_val.index), set(X_test.index)
+    assert not (train_rows & val_rows or train_rows & test_rows or val_rows & test_rows), "Splits should not share rows"
+    assert len(train_rows | val_rows | test_rows) == 1000, "Splits should cover every row"
+
+    for y in (y_train, y_val, y_test):
+        assert y.mean() == pytest.approx(0.2), "Each split should keep the 20% positive rate"
+
 def test_model_training(mock_data, mock_model):
     """Test the model training process."""
     X_train, X_val, X_test, y_train, y_val, y_test = mock_data
@@ -55,6 +76,24 @@ def test_model_evaluation(mock_data, mock_model):
     assert isinstance(auc_score, float), "AUC score should be a float"
     assert 0 <= auc_score <= 1, "AUC score should be between 0 and 1"
 
+def test_fast_auc_matches_sklearn():
+    """Test that the rank-based AUC matches sklearn, including tied scores."""
+    rng = np.random.default_rng(0)
+    y_true = rng.integers(0, 2, size=500)
+    y_score = np.round(rng.random(500), 1)  # Coarse scores to force ties
+
+    assert np.isclose(fast_auc(y_true, y_score), roc_auc_score(y_true, y_score)), "fast_auc should match roc_auc_score"
+
+    # Like roc_auc_score, a single-class split has no defined AUC
+    with pytest.raises(ValueError):
+        fast_auc(np.ones(10, dtype=int), rng.random(10))
+
+    # Non-finite scores and non-0/1 labels are rejected rather than scored silently
+    with pytest.raises(ValueError):
+        fast_auc([0, 1, 0, 1], [0.1, np.nan, 0.3, 0.9])
+    with pytest.raises(ValueError):
+        fast_auc([1, 2, 1, 2], [0.1, 0.8, 0.3, 0.9])
+
 def test_mlflow_logging(mock_data, mock_model):
     """Test that the model is logged correctly to MLflow."""
     X_train, X_val, X_test, y_train, y_val, y_test = mock_data
@@ -71,6 +110,20 @@ def test_mlflow_logging(mock_data, mock_model):
         mlflow.start_run.assert_called_once()
         assert run_id is not None, "Run ID should be returned from the experiment"
 
+def test_logged_signature_types(mock_data, mock_model, monkeypatch):
+    """Test that the logged signature keeps the dtypes inference data arrives with."""
+    X_train, X_val, X_test, y_train, y_val, y_test = mock_data
+    mock_model.train(X_train, y_train)
+
+    log_model = MagicMock()
+    monkeypatch.setattr(mlflow.sklearn, 'log_model', log_model)
+    mock_model.log_model(X_train)
+    signature = log_model.call_args.kwargs['signature']
+
+    input_types = {col['name']: col['type'] for col in signature.inputs.to_dict()}
+    assert input_types.pop('is_red') == 'long', "is_red should be logged as long"
+    assert set(input_types.values()) == {'double'}, "Physicochemical features should be logged as double"
+
 def test_feature_importance(mock_data, mock_model):
     """Test feature importance extraction."""
     X_train, X_val, X_test, y_train, y_val, y_test = mock_data